@@ -3,12 +3,18 @@ import cv2
 import tkinter as tk
 from tkinter import messagebox, Label, Button, Frame
 from PIL import Image, ImageTk
-from ultralytics import YOLO
+import numpy as np
 import google.generativeai as genai
 import pyttsx3
+import datetime
+import glob
 import time
 import threading
+import queue
 import os
+import platform
+import shutil
+from pathlib import Path
 
 # --- 1. SETUP & CONFIGURATION ---
 
@@ -18,13 +24,246 @@ try:
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     if not GEMINI_API_KEY:
         raise ValueError("GEMINI_API_KEY environment variable not found.")
-    genai.configure(api_key=GEMINI_API_KEY)
+    # The gRPC transport keeps one HTTP/2 channel open across calls, so the
+    # 4-second analysis cadence doesn't pay a fresh TLS handshake each time.
+    genai.configure(api_key=GEMINI_API_KEY, transport="grpc")
 except Exception as e:
     # Use messagebox for better visibility in a GUI app
     messagebox.showerror("API Key Error", f"Error configuring Gemini API: {e}\nPlease ensure you have set the GEMINI_API_KEY environment variable.")
     exit()
 
-# --- 2. MAIN APPLICATION CLASS ---
+# Exported models live here so restarts never repeat the download and
+# quantization work, which can take a minute or more on first run.
+MODEL_CACHE_DIR = Path("~/.cache/walkpath").expanduser()
+
+NAV_PROMPT = """
+You are an expert navigation assistant for a visually impaired user.
+Your task is to analyze the provided image of an indoor scene and give ONE SINGLE, SHORT, and CLEAR instruction for safe navigation.
+Focus on immediate obstacles and the clearest path forward.
+Use clock-face directions (e.g., "chair at 2 o'clock") when useful.
+Your response must be a direct command.
+
+Examples:
+- "Clear path ahead. Walk forward."
+- "Obstacle detected. Proceed with caution."
+- "Stairs ahead. Stop."
+- "Door is slightly to your left."
+- "Table at your 1 o'clock. go right."
+"""
+
+# --- 2. OBJECT DETECTION BACKEND ---
+def _load_export_names(model_dir):
+    """Reads class names from the metadata.yaml left by the exporter."""
+    try:
+        import yaml
+        with open(os.path.join(model_dir, "metadata.yaml")) as f:
+            return yaml.safe_load(f)["names"]
+    except Exception:
+        return {}
+
+
+def _decode_yolo_output(preds, sx, sy, conf_thres, iou_thres):
+    """Decodes a YOLOv8 (4 + num_classes, num_anchors) head into boxes.
+
+    sx/sy map the model's coordinate space onto frame pixels. Returns a
+    list of (x1, y1, x2, y2, conf, cls) tuples after confidence filtering
+    and OpenCV's C++ NMS.
+    """
+    scores = preds[4:]
+    cls_ids = scores.argmax(axis=0)
+    confs = scores[cls_ids, np.arange(scores.shape[1])]
+    keep = confs >= conf_thres
+    if not keep.any():
+        return []
+
+    cxcywh = preds[:4, keep].T
+    confs = confs[keep]
+    cls_ids = cls_ids[keep]
+    xywh = np.stack([
+        (cxcywh[:, 0] - cxcywh[:, 2] / 2) * sx,
+        (cxcywh[:, 1] - cxcywh[:, 3] / 2) * sy,
+        cxcywh[:, 2] * sx,
+        cxcywh[:, 3] * sy,
+    ], axis=1)
+
+    picked = cv2.dnn.NMSBoxes(xywh.tolist(), confs.tolist(), conf_thres, iou_thres)
+    detections = []
+    for i in np.array(picked).flatten():
+        x, y, bw, bh = xywh[i]
+        detections.append((int(x), int(y), int(x + bw), int(y + bh),
+                           float(confs[i]), int(cls_ids[i])))
+    return detections
+
+
+class OpenVINODetector:
+    """Torch-free YOLOv8 detector on the raw OpenVINO Runtime.
+
+    Going through openvino directly skips the Ultralytics predictor layer
+    (torch tensors, Results objects, per-call setup), which costs several
+    milliseconds of Python overhead on every frame. Preprocessing is a
+    single fused cv2.dnn.blobFromImage and NMS runs in OpenCV's C++ code.
+    """
+
+    INPUT_SIZE = 640
+
+    def __init__(self, model_dir, conf_thres=0.25, iou_thres=0.45,
+                 throughput_mode=False):
+        import openvino as ov
+        core = ov.Core()
+        model = core.read_model(os.path.join(model_dir, "yolov8s.xml"))
+        # The webcam loop is normally single-stream, so compile for latency:
+        # one NUMA node, a small thread pool, no extra infer streams. In
+        # throughput mode (display rate lagging the camera) two streams and
+        # the THROUGHPUT hint let batched calls overlap instead.
+        # Threads are capped at the physical core count and pinned: SMT
+        # siblings share execution ports, so scheduling inference on logical
+        # cores only adds latency jitter.
+        self.throughput_mode = throughput_mode
+        hint = ({"PERFORMANCE_HINT": "THROUGHPUT", "NUM_STREAMS": "2"}
+                if throughput_mode else {"PERFORMANCE_HINT": "LATENCY"})
+        if throughput_mode:
+            # The exported IR is static [1,3,640,640]; give the batch axis a
+            # 1..2 range before compiling or infer_batch's two-frame blob
+            # would be rejected at runtime.
+            model.reshape([ov.Dimension(1, 2), 3, self.INPUT_SIZE, self.INPUT_SIZE])
+        try:
+            import psutil
+            num_threads = psutil.cpu_count(logical=False) or max(1, os.cpu_count() // 2)
+        except ImportError:
+            num_threads = max(1, os.cpu_count() // 2)
+        try:
+            self.compiled_model = core.compile_model(
+                model, "CPU",
+                dict(hint, INFERENCE_NUM_THREADS=num_threads,
+                     ENABLE_HYPER_THREADING="NO", AFFINITY="CORE"))
+        except Exception:
+            # Older OpenVINO releases don't know the pinning properties.
+            self.compiled_model = core.compile_model(
+                model, "CPU", dict(hint, INFERENCE_NUM_THREADS=num_threads))
+        self.output = self.compiled_model.output(0)
+        self.conf_thres = conf_thres
+        self.iou_thres = iou_thres
+        self.names = _load_export_names(model_dir)
+
+        # The first inferences JIT-specialize the oneDNN kernels, costing
+        # several hundred milliseconds. Warm up on dummy frames here so the
+        # Start button is instantly responsive instead of stalling the GUI.
+        warmup = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(3):
+            self.infer(warmup)
+
+    def infer(self, frame):
+        """Runs detection on a BGR frame.
+
+        Returns a list of (x1, y1, x2, y2, conf, cls) tuples in original
+        frame coordinates.
+        """
+        h, w = frame.shape[:2]
+        blob = cv2.dnn.blobFromImage(
+            frame, 1 / 255.0, (self.INPUT_SIZE, self.INPUT_SIZE), swapRB=True)
+        # Output is (1, 4 + num_classes, num_anchors): cx,cy,w,h rows first,
+        # then one score row per class, in stretched 640x640 coordinates.
+        preds = self.compiled_model([blob])[self.output][0]
+        return _decode_yolo_output(preds, w / self.INPUT_SIZE, h / self.INPUT_SIZE,
+                                   self.conf_thres, self.iou_thres)
+
+    def infer_batch(self, frames):
+        """Runs detection on several same-sized BGR frames in one call.
+
+        One call over a small batch amortizes per-call dispatch and keeps
+        the int8 pipelines fed; worthwhile only under the THROUGHPUT
+        compile. Returns one detection list per frame.
+        """
+        h, w = frames[0].shape[:2]
+        blob = cv2.dnn.blobFromImages(
+            frames, 1 / 255.0, (self.INPUT_SIZE, self.INPUT_SIZE), swapRB=True)
+        preds = self.compiled_model([blob])[self.output]
+        return [_decode_yolo_output(p, w / self.INPUT_SIZE, h / self.INPUT_SIZE,
+                                    self.conf_thres, self.iou_thres)
+                for p in preds]
+
+
+class TFLiteDetector:
+    """INT8 TFLite YOLOv8 detector for ARM-class CPUs.
+
+    On Raspberry Pi / mobile hosts the XNNPACK delegate's int8 kernels
+    (dotprod/i8mm on newer Cortex cores) are several times faster than the
+    x86-oriented OpenVINO path, so ARM machines get this backend instead.
+    """
+
+    INPUT_SIZE = 640
+
+    def __init__(self, model_dir, conf_thres=0.25, iou_thres=0.45):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+        # The int8 export writes *_full_integer_quant.tflite into the
+        # saved_model directory; find it by pattern instead of assuming a
+        # fixed name, with any other .tflite in the directory as fallback.
+        candidates = (sorted(glob.glob(os.path.join(model_dir, "*_full_integer_quant.tflite")))
+                      or sorted(glob.glob(os.path.join(model_dir, "*.tflite"))))
+        if not candidates:
+            raise FileNotFoundError(f"No .tflite model found in {model_dir}")
+        self.interpreter = Interpreter(
+            model_path=candidates[0],
+            num_threads=os.cpu_count() or 4)
+        self.interpreter.allocate_tensors()
+        self.input_detail = self.interpreter.get_input_details()[0]
+        self.output_detail = self.interpreter.get_output_details()[0]
+        self.conf_thres = conf_thres
+        self.iou_thres = iou_thres
+        self.names = _load_export_names(model_dir)
+
+    def infer(self, frame):
+        """Runs detection on a BGR frame; same contract as OpenVINODetector."""
+        h, w = frame.shape[:2]
+        img = cv2.cvtColor(cv2.resize(frame, (self.INPUT_SIZE, self.INPUT_SIZE)),
+                           cv2.COLOR_BGR2RGB).astype(np.float32) / 255.0
+        if self.input_detail["dtype"] == np.int8:
+            scale, zero = self.input_detail["quantization"]
+            img = (img / scale + zero).astype(np.int8)
+        self.interpreter.set_tensor(self.input_detail["index"], img[None])
+        self.interpreter.invoke()
+
+        preds = self.interpreter.get_tensor(self.output_detail["index"])[0]
+        if self.output_detail["dtype"] == np.int8:
+            scale, zero = self.output_detail["quantization"]
+            preds = (preds.astype(np.float32) - zero) * scale
+        # TFLite exports emit normalized cx,cy,w,h, so the scale factors map
+        # straight to frame pixels.
+        return _decode_yolo_output(preds, w, h, self.conf_thres, self.iou_thres)
+
+
+class TensorRTDetector:
+    """YOLOv8 detector on a TensorRT engine for NVIDIA GPU / Jetson hosts.
+
+    A TensorRT FP16 engine beats any of the CPU backends by an order of
+    magnitude and leaves the CPU threads free for display and speech. The
+    Ultralytics wrapper handles the engine bindings, so this class only
+    adapts its results to the common detector contract.
+    """
+
+    def __init__(self, engine_path, conf_thres=0.25, iou_thres=0.45):
+        from ultralytics import YOLO
+        self.model = YOLO(engine_path, task="detect")
+        self.conf_thres = conf_thres
+        self.iou_thres = iou_thres
+        self.names = self.model.names
+
+    def infer(self, frame):
+        """Runs detection on a BGR frame; same contract as OpenVINODetector."""
+        results = self.model(frame, imgsz=640, conf=self.conf_thres,
+                             iou=self.iou_thres, verbose=False)
+        boxes = results[0].boxes
+        return [(int(x1), int(y1), int(x2), int(y2), float(conf), int(cls))
+                for (x1, y1, x2, y2), conf, cls in zip(
+                    boxes.xyxy.cpu().numpy(),
+                    boxes.conf.cpu().numpy(),
+                    boxes.cls.cpu().numpy())]
+
+
+# --- 3. MAIN APPLICATION CLASS ---
 class WalkPathNavApp:
     def __init__(self, window, title):
         self.window = window
@@ -37,27 +276,128 @@ class WalkPathNavApp:
         self.is_running = False
         self.cap = None
         self.latest_frame = None
+        self._frame_lock = threading.Lock()
         self.ai_thread = None
-        self.last_spoken_time = 0
+        self._stop_evt = threading.Event()
+        self._imgtk = None
+        self._rgb_buf = None
+
+        # --- Pipeline State ---
+        # Bounded queues decouple capture, inference, and display so a slow
+        # YOLO call never stalls the camera or the GUI.
+        self._read_q = None
+        self._render_q = None
+        self._reader_thread = None
+        self._infer_thread = None
+        self._prev_small = None
+        self._last_annotated = None
+        self._tick = 0
+        self._cached_detections = None
+        self._annot_buf = None
 
         # --- AI & Engine Setup ---
         try:
-            # NOTE: If 'yolov8s.pt' is not found, Ultralytics will attempt to
-            # download it automatically. This requires an internet connection.
-            self.yolo_model = YOLO("yolov8s.pt")
-            self.gemini_model = genai.GenerativeModel("gemini-1.5-flash-latest")
+            self.detector = self._load_detector()
+            self.gemini_model = self._build_gemini_model()
             self.tts_engine = pyttsx3.init()
         except Exception as e:
             messagebox.showerror("Initialization Error", f"Failed to initialize models or TTS engine: {e}")
             self.window.destroy()
             return
 
+        # Speech runs on its own consumer thread so a 1-3 second utterance
+        # never blocks the Gemini analysis cadence.
+        self._tts_q = queue.Queue()
+        self._tts_thread = threading.Thread(target=self._tts_loop, daemon=True)
+        self._tts_thread.start()
+
         # --- GUI Setup ---
         self.setup_gui()
 
         # Handle window closing event gracefully
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
 
+    def _load_detector(self):
+        """Loads the object detector, producing the OpenVINO INT8 export if needed.
+
+        Running the INT8 OpenVINO model instead of the FP32 PyTorch weights
+        gives roughly 2-4x more CPU throughput on VNNI-capable processors,
+        which matters because detection runs on every video tick. Ultralytics
+        (and with it torch) is imported lazily, only for the one-time export.
+        """
+        # NVIDIA GPU / Jetson hosts run a TensorRT FP16 engine, which beats
+        # any CPU backend by an order of magnitude and keeps the CPU free
+        # for the display and speech threads.
+        try:
+            import torch
+            has_cuda = torch.cuda.is_available()
+        except ImportError:
+            has_cuda = False
+        if has_cuda:
+            engine_path = self._cached_export(
+                "yolov8s.engine", format="engine", half=True, device=0)
+            return TensorRTDetector(engine_path)
+
+        # ARM-class hosts (Raspberry Pi and friends) get the TFLite/XNNPACK
+        # backend; OpenVINO's int8 path is x86-oriented.
+        if platform.machine() in ("aarch64", "armv7l", "arm64"):
+            export_dir = self._cached_export(
+                "yolov8s_saved_model", format="tflite", int8=True, data="coco128.yaml")
+            return TFLiteDetector(export_dir)
+
+        # For CPU inference, Ultralytics quantizes with NNCF (performance
+        # preset) using coco128 as the calibration set.
+        export_dir = self._cached_export(
+            "yolov8s_int8_openvino_model", format="openvino", int8=True, data="coco128.yaml")
+        # WALKPATH_THROUGHPUT=1 opts into batched two-frame inference for
+        # setups where the camera outpaces the display; the default stays
+        # latency-oriented for the interactive loop.
+        return OpenVINODetector(
+            export_dir, throughput_mode=os.getenv("WALKPATH_THROUGHPUT") == "1")
+
+    @staticmethod
+    def _cached_export(artifact, **export_kwargs):
+        """Returns the cached path of an exported model, exporting on first use.
+
+        The Ultralytics export (weight download plus quantization) can take
+        over a minute, so the produced artifact is moved into
+        MODEL_CACHE_DIR and every later launch loads it from there.
+        NOTE: If 'yolov8s.pt' is not found, Ultralytics will attempt to
+        download it automatically. This requires an internet connection.
+        """
+        target = MODEL_CACHE_DIR / artifact
+        if not target.exists():
+            from ultralytics import YOLO
+            MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            YOLO("yolov8s.pt").export(**export_kwargs)
+            # The exporter writes next to the weights; move the known
+            # artifact name into the cache.
+            shutil.move(artifact, str(target))
+        return str(target)
+
+    def _build_gemini_model(self):
+        """Builds the Gemini model, caching the navigation prompt server-side.
+
+        With CachedContent the recurring scene-analysis calls upload only
+        the image plus a cache handle instead of re-sending (and re-
+        tokenizing) the prompt every cycle. Caching has server-side
+        eligibility limits (current models require a 32k-token minimum,
+        far above this prompt), so the inline-prompt fallback here is the
+        expected path; run_gemini_assistant also falls back mid-session if
+        the cache expires after its TTL.
+        """
+        try:
+            cached = genai.caching.CachedContent.create(
+                model="gemini-1.5-flash-latest",
+                contents=[NAV_PROMPT],
+                ttl=datetime.timedelta(minutes=10))
+            self._prompt_cached = True
+            return genai.GenerativeModel.from_cached_content(cached)
+        except Exception as e:
+            print(f"[Gemini]: Prompt caching unavailable ({e}); sending the prompt inline.")
+            self._prompt_cached = False
+            return genai.GenerativeModel("gemini-1.5-flash-latest")
+
     def setup_gui(self):
         # Main content frame
         content_frame = Frame(self.window, bg="#f0f0f0")
@@ -92,19 +432,48 @@ class WalkPathNavApp:
         if self.is_running:
             return
 
-        # Attempt to open the default camera
-        self.cap = cv2.VideoCapture(0)
+        # Attempt to open the default camera. On Linux go through V4L2
+        # explicitly so the MJPG request below is honored.
+        if platform.system() == "Linux":
+            self.cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
+        else:
+            self.cap = cv2.VideoCapture(0)
         if not self.cap.isOpened():
             messagebox.showerror("Webcam Error", "Could not access the webcam. Please ensure it is connected and not in use by another application.")
             return
 
+        # Ask for MJPG instead of the default YUYV: the USB link then
+        # carries compressed frames and libjpeg-turbo's SIMD decode is
+        # cheaper than the raw YUV->BGR conversion it replaces.
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
+        # Ask the camera for 640x480@30 up front. Capturing at native
+        # resolution (often 1280x720) only to letterbox down to 640 for
+        # YOLO wastes a full-frame resize on every tick.
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+
         self.is_running = True
         self.btn_start.config(state=tk.DISABLED)
         self.btn_stop.config(state=tk.NORMAL)
         self.update_status_label("Activating systems...")
         self.speak("Navigation system activated.")
 
+        # Start the capture -> inference -> display pipeline
+        self._read_q = queue.Queue(maxsize=2)
+        self._render_q = queue.Queue(maxsize=2)
+        self._prev_small = None
+        self._last_annotated = None
+        self._tick = 0
+        self._cached_detections = None
+        self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self._infer_thread = threading.Thread(target=self._inference_loop, daemon=True)
+        self._reader_thread.start()
+        self._infer_thread.start()
+
         # Start the AI processing in a separate thread to not freeze the GUI
+        self._stop_evt.clear()
         self.ai_thread = threading.Thread(target=self.run_gemini_assistant, daemon=True)
         self.ai_thread.start()
 
@@ -116,15 +485,22 @@ class WalkPathNavApp:
             return
 
         self.is_running = False
+        self._stop_evt.set()
         self.btn_start.config(state=tk.NORMAL)
         self.btn_stop.config(state=tk.DISABLED)
 
+        # Let the pipeline threads drain before releasing the camera
+        for thread in (self._reader_thread, self._infer_thread):
+            if thread and thread.is_alive():
+                thread.join(timeout=1.0)
+
         # Release the camera
         if self.cap:
             self.cap.release()
             self.cap = None
 
         # Reset the video label to its initial state
+        self._imgtk = None
         self.video_label.config(image='', text="Camera is off", bg="black")
         self.update_status_label("System offline. Press Start to begin.")
         self.speak("Navigation system shutting down.")
@@ -136,80 +512,223 @@ class WalkPathNavApp:
         self.window.after(200, self.window.destroy)
 
 
-    def update_frame(self):
-        """Continuously gets a frame from the webcam and displays it."""
-        # Only run if the system is active and camera is available
-        if self.is_running and self.cap:
+    def _reader_loop(self):
+        """Capture thread: pulls frames from the webcam as fast as it delivers them."""
+        while self.is_running and self.cap:
             ret, frame = self.cap.read()
-            if ret:
-                # Store a copy of the raw frame for the AI thread
-                self.latest_frame = frame.copy()
-
-                # Process with YOLO for object detection and get the annotated frame
-                results = self.yolo_model(frame, verbose=False)
-                annotated_frame = results[0].plot()
-
-                # Convert the frame for Tkinter display
-                rgb_frame = cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(rgb_frame)
-                imgtk = ImageTk.PhotoImage(image=img)
+            if not ret:
+                time.sleep(0.01)
+                continue
+            try:
+                self._read_q.put_nowait(frame)
+            except queue.Full:
+                # Drop the frame; a short queue keeps display latency low.
+                pass
+
+    def _inference_loop(self):
+        """Inference thread: runs YOLO on captured frames and queues the results."""
+        while self.is_running:
+            try:
+                frame = self._read_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            # Share the raw frame with the AI thread by reference; copying a
+            # full frame every tick is pure memory-bandwidth waste when the
+            # Gemini path only samples it every few seconds.
+            with self._frame_lock:
+                self.latest_frame = frame
+
+            try:
+                annotated_frame = self._process_frame(frame)
+            except Exception as e:
+                # A detector failure must not silently kill this thread and
+                # freeze the video; report it and keep consuming frames.
+                print(f"[Detector Error]: {e}")
+                self.update_status_label("Detector error: see console for details.")
+                continue
+
+            try:
+                self._render_q.put_nowait(annotated_frame)
+            except queue.Full:
+                pass
+
+    def _process_frame(self, frame):
+        """Runs the gating/detection/annotation step for one captured frame."""
+        # Static-scene gate: a 32x32 mean-absolute-difference costs a
+        # fraction of a millisecond, a YOLO pass tens of them. If the
+        # scene hasn't changed, redisplay the previous annotated frame.
+        small = cv2.resize(frame, (32, 32)).astype(np.int16)
+        if (self._prev_small is not None and self._last_annotated is not None
+                and np.abs(small - self._prev_small).mean() < 3.0):
+            annotated_frame = self._last_annotated
+        else:
+            # Run the detector only on every third changed frame; boxes
+            # refreshed at ~10 Hz are visually indistinguishable from
+            # the full display rate, and the cached detections are still
+            # drawn onto each fresh frame in between.
+            if self._tick % 3 == 0 or self._cached_detections is None:
+                # Under the THROUGHPUT compile, grab a second queued frame
+                # (when one is waiting) and infer both in a single batched
+                # call; the amortized dispatch roughly doubles frames
+                # processed per second at the same CPU utilization.
+                frames = [frame]
+                if getattr(self.detector, "throughput_mode", False):
+                    try:
+                        frames.append(self._read_q.get_nowait())
+                    except queue.Empty:
+                        pass
+                if len(frames) > 1:
+                    self._cached_detections = self.detector.infer_batch(frames)[-1]
+                    frame = frames[-1]
+                    with self._frame_lock:
+                        self.latest_frame = frame
+                else:
+                    self._cached_detections = self.detector.infer(frame)
+            self._tick += 1
+            # Draw onto a reused annotation buffer, never onto the frame
+            # itself: the raw frame is shared with the Gemini thread, and
+            # overlays painted into the model's input would occlude the very
+            # obstacles it is asked to describe (and race with its copy()).
+            if self._annot_buf is None or self._annot_buf.shape != frame.shape:
+                self._annot_buf = np.empty_like(frame)
+            np.copyto(self._annot_buf, frame)
+            annotated_frame = self._draw_detections(self._annot_buf, self._cached_detections)
+            self._last_annotated = annotated_frame
+        self._prev_small = small
+        return annotated_frame
+
+    def _draw_detections(self, frame, detections):
+        """Draws detection boxes directly on the given frame with OpenCV.
+
+        cv2.rectangle/cv2.putText draw in place through SIMD-optimized C,
+        avoiding the fresh allocation and PIL label rendering that a
+        framework-side plot() call would pay on every frame. Callers pass
+        the reused annotation buffer, not the raw captured frame.
+        """
+        names = self.detector.names
+        for x1, y1, x2, y2, conf, cls in detections:
+            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            cv2.putText(frame, f"{names.get(cls, cls)} {conf:.2f}", (x1, max(y1 - 6, 12)),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1, cv2.LINE_AA)
+        return frame
 
-                # Update the video label with the new frame
-                self.video_label.imgtk = imgtk
-                self.video_label.config(image=imgtk)
+    def update_frame(self):
+        """Displays the most recently rendered frame on the GUI."""
+        # Only run if the system is active
+        if self.is_running:
+            try:
+                annotated_frame = self._render_q.get_nowait()
+            except queue.Empty:
+                annotated_frame = None
+
+            if annotated_frame is not None:
+                # Convert the frame for Tkinter display, writing into one
+                # preallocated buffer: cvtColor's dst= avoids allocating and
+                # freeing ~1 MB on every tick.
+                if self._rgb_buf is None or self._rgb_buf.shape != annotated_frame.shape:
+                    self._rgb_buf = np.empty_like(annotated_frame)
+                cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+                img = Image.fromarray(self._rgb_buf)
+
+                # Reuse one PhotoImage and paste into it; rebuilding the
+                # Tk image object every tick churns memory for no benefit.
+                if self._imgtk is None or (self._imgtk.width(), self._imgtk.height()) != img.size:
+                    self._imgtk = ImageTk.PhotoImage(image=img)
+                    self.video_label.config(image=self._imgtk)
+                else:
+                    self._imgtk.paste(img)
 
             # Schedule the next frame update
-            self.window.after(20, self.update_frame)
+            self.window.after(15, self.update_frame)
 
     def run_gemini_assistant(self):
         """Runs in a separate thread, sending frames to Gemini for analysis."""
-        nav_prompt = """
-        You are an expert navigation assistant for a visually impaired user.
-        Your task is to analyze the provided image of an indoor scene and give ONE SINGLE, SHORT, and CLEAR instruction for safe navigation.
-        Focus on immediate obstacles and the clearest path forward.
-        Use clock-face directions (e.g., "chair at 2 o'clock") when useful.
-        Your response must be a direct command.
-
-        Examples:
-        - "Clear path ahead. Walk forward."
-        - "Obstacle detected. Proceed with caution."
-        - "Stairs ahead. Stop."
-        - "Door is slightly to your left."
-        - "Table at your 1 o'clock. go right."
-        """
-
-        while self.is_running:
-            # Check if it's time to generate a new instruction (e.g., every 4 seconds)
-            if (time.time() - self.last_spoken_time > 4) and self.latest_frame is not None:
-                self.last_spoken_time = time.time()
+        # Event.wait parks the thread for exactly one 4-second cadence
+        # instead of waking every 0.5 s to poll the wall clock, and lets
+        # stop_navigation tear the loop down immediately via set().
+        while not self._stop_evt.wait(4.0):
+            if self.latest_frame is not None:
                 try:
                     self.update_status_label("Analyzing scene...")
-                    # Convert frame to PIL Image for the API
-                    pil_image = Image.fromarray(cv2.cvtColor(self.latest_frame, cv2.COLOR_BGR2RGB))
-                    
+                    # Copy under the lock so the inference thread is free to
+                    # publish new frames while we talk to the API.
+                    with self._frame_lock:
+                        frame = self.latest_frame.copy()
+                    # JPEG-encode with OpenCV (libjpeg-turbo): roughly 10x
+                    # fewer upload bytes than the PNG the SDK would build
+                    # from a raw PIL image, at no semantic quality loss.
+                    ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
+                    if not ok:
+                        raise RuntimeError("JPEG encoding of the frame failed")
+                    image_part = {"mime_type": "image/jpeg", "data": buf.tobytes()}
+
+                    # When the prompt is cached server-side only the image
+                    # travels; otherwise send the prompt inline as before.
+                    contents = ([image_part] if self._prompt_cached
+                                else [NAV_PROMPT, image_part])
                     response = self.gemini_model.generate_content(
-                        [nav_prompt, pil_image],
+                        contents,
+                        stream=True,
                         request_options={'timeout': 20} # Timeout after 20 seconds
                     )
-                    advice = response.text.strip().replace("*", "") # Clean up response
 
-                    self.update_status_label(f"AI Cue: {advice}")
-                    self.speak(advice)
+                    # Stream the answer: update the label chunk by chunk and
+                    # hand the first complete sentence to TTS immediately
+                    # instead of waiting for the full response.
+                    advice = ""
+                    spoken_upto = 0
+                    for chunk in response:
+                        if not chunk.text:
+                            continue
+                        advice += chunk.text
+                        self.update_status_label(f"AI Cue: {advice.strip().replace('*', '')}")
+                        if spoken_upto == 0:
+                            for mark in (".", "!", "?"):
+                                end = advice.find(mark)
+                                if end != -1:
+                                    self.speak(advice[:end + 1].strip().replace("*", ""))
+                                    spoken_upto = end + 1
+                                    break
+
+                    # Queue whatever followed the first sentence as a
+                    # continuation, without displacing the part already queued.
+                    rest = advice[spoken_upto:].strip().replace("*", "")
+                    if rest:
+                        self._tts_q.put_nowait(rest)
 
                 except Exception as e:
                     print(f"[Gemini Error]: {e}")
+                    if self._prompt_cached:
+                        # The server-side prompt cache outlives its TTL only
+                        # while we keep it alive, which we don't; once it
+                        # expires every call on the cached model fails. Drop
+                        # back to the inline prompt so the next cycle works.
+                        print("[Gemini]: Cached prompt unusable; sending the prompt inline from now on.")
+                        self._prompt_cached = False
+                        self.gemini_model = genai.GenerativeModel("gemini-1.5-flash-latest")
                     self.update_status_label("AI Error: Could not get navigation cue.")
-            
-            # Sleep briefly to prevent high CPU usage
-            time.sleep(0.5)
+
+    def _tts_loop(self):
+        """Dedicated speech thread: plays queued utterances one at a time."""
+        while True:
+            text = self._tts_q.get()
+            try:
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
+            except Exception as e:
+                print(f"[TTS Error]: {e}")
 
     def speak(self, text):
-        """Speaks the given text using the TTS engine."""
+        """Queues the given text for the TTS thread; never blocks the caller."""
+        # A navigation cue that hasn't been spoken yet is already stale once
+        # newer advice arrives, so drop anything still waiting in the queue.
         try:
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
-        except Exception as e:
-            print(f"[TTS Error]: {e}")
+            while True:
+                self._tts_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._tts_q.put_nowait(text)
 
     def update_status_label(self, text):
         """Safely updates the GUI label from any thread."""
@@ -217,7 +736,7 @@ class WalkPathNavApp:
         self.window.after(0, lambda: self.ai_status_label.config(text=text))
 
 
-# --- 3. MAIN ENTRY POINT ---
+# --- 4. MAIN ENTRY POINT ---
 if __name__ == "__main__":
     root = tk.Tk()
     app = WalkPathNavApp(root, "AI Indoor Navigation Assistant")